@@ -23,6 +23,8 @@ from pyspark.sql.connect.utils import check_dependencies
 
 check_dependencies(__name__)
 
+import copy
+import itertools
 import logging
 import os
 import platform
@@ -550,6 +552,7 @@ class SparkConnectClient(object):
         userId: Optional[str] = None,
         channelOptions: Optional[List[Tuple[str, Any]]] = None,
         retryPolicy: Optional[Dict[str, Any]] = None,
+        channelPoolSize: int = 4,
     ):
         """
         Creates a new SparkSession for the Spark Connect interface.
@@ -565,7 +568,20 @@ class SparkConnectClient(object):
             isolate their Spark Sessions. If the `user_id` is not set, will default to
             the $USER environment. Defining the user ID as part of the connection string
             takes precedence.
+        channelPoolSize : int
+            Number of independent GRPC channels that the RPCs are distributed over in a
+            round-robin manner. Defaults to 4. A single channel is used when `connection`
+            is a ChannelBuilder that overrides `toChannel`.
         """
+        if channelPoolSize < 1:
+            raise PySparkValueError(
+                error_class="VALUE_NOT_POSITIVE",
+                message_parameters={
+                    "arg_name": "channelPoolSize",
+                    "arg_value": str(channelPoolSize),
+                },
+            )
+
         # Parse the connection string.
         self._builder = (
             connection
@@ -593,11 +609,38 @@ class SparkConnectClient(object):
         else:
             self._user_id = os.getenv("USER", None)
 
-        self._channel = self._builder.toChannel()
-        self._stub = grpc_lib.SparkConnectServiceStub(self._channel)
+        # GRPC shares one connection between channels with the same target and arguments
+        # through its global subchannel pool. A local subchannel pool per channel gives each
+        # channel its own HTTP/2 connection, so concurrent RPCs do not contend for the
+        # flow-control window of a single connection. A builder that overrides `toChannel`
+        # may not apply that option, so it gets a single channel.
+        if type(self._builder).toChannel is not ChannelBuilder.toChannel:
+            channelPoolSize = 1
+        if channelPoolSize == 1:
+            self._channels = [self._builder.toChannel()]
+        else:
+            pooled_builder = copy.copy(self._builder)
+            pooled_builder._channel_options = self._builder._channel_options + [
+                ("grpc.use_local_subchannel_pool", 1)
+            ]
+            self._channels = [pooled_builder.toChannel() for _ in range(channelPoolSize)]
+        self._channel = self._channels[0]
+        self._stubs = [grpc_lib.SparkConnectServiceStub(channel) for channel in self._channels]
+        self._stub_counter = itertools.count()
+        # Cache of `get_configs` results. It is invalidated whenever a configuration may have
+        # been changed, i.e., by a non-read config operation or by a command such as `SET`.
+        self._config_cache: Dict[Tuple[str, ...], Tuple[Optional[str], ...]] = {}
+        # Bumped on every invalidation, so that a read racing with a change is not cached.
+        self._config_generation = 0
         self._artifact_manager = ArtifactManager(self._user_id, self._session_id, self._channel)
         # Configure logging for the SparkConnect client.
 
+    @property
+    def _stub(self) -> grpc_lib.SparkConnectServiceStub:
+        # Picks the stubs in a round-robin manner. `next` on `itertools.count` is atomic
+        # under the GIL so this is safe to call from multiple threads.
+        return self._stubs[next(self._stub_counter) % len(self._stubs)]
+
     def register_udf(
         self,
         function: Any,
@@ -808,7 +851,11 @@ class SparkConnectClient(object):
         if self._user_id:
             req.user_context.user_id = self._user_id
         req.plan.command.CopyFrom(command)
-        data, _, _, _, properties = self._execute_and_fetch(req)
+        try:
+            data, _, _, _, properties = self._execute_and_fetch(req)
+        finally:
+            # Invalidate only once the server has applied the command, e.g., `SET`.
+            self._invalidate_config_cache()
         if data is not None:
             return (data.to_pandas(), properties)
         else:
@@ -830,11 +877,28 @@ class SparkConnectClient(object):
         assert result is not None
         return result
 
+    def _warmup(self, timeout: float = 10.0) -> None:
+        """
+        Eagerly establish the connections of all pooled channels so that the first RPC
+        does not pay for the connection handshake. Failures are ignored here, and are
+        surfaced by the actual RPCs instead.
+        """
+        # Creating the futures first starts connecting all channels concurrently, so they
+        # share a single deadline instead of waiting for `timeout` each.
+        deadline = time.monotonic() + timeout
+        futures = [grpc.channel_ready_future(channel) for channel in self._channels]
+        for future in futures:
+            try:
+                future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception:
+                future.cancel()
+
     def close(self) -> None:
         """
-        Close the channel.
+        Close the channels.
         """
-        self._channel.close()
+        for channel in self._channels:
+            channel.close()
 
     @property
     def host(self) -> str:
@@ -1106,10 +1170,20 @@ class SparkConnectClient(object):
             req.user_context.user_id = self._user_id
         return req
 
+    def _invalidate_config_cache(self) -> None:
+        self._config_generation += 1
+        self._config_cache.clear()
+
     def get_configs(self, *keys: str) -> Tuple[Optional[str], ...]:
-        op = pb2.ConfigRequest.Operation(get=pb2.ConfigRequest.Get(keys=keys))
-        configs = dict(self.config(op).pairs)
-        return tuple(configs.get(key) for key in keys)
+        result = self._config_cache.get(keys)
+        if result is None:
+            generation = self._config_generation
+            op = pb2.ConfigRequest.Operation(get=pb2.ConfigRequest.Get(keys=keys))
+            configs = dict(self.config(op).pairs)
+            result = tuple(configs.get(key) for key in keys)
+            if generation == self._config_generation:
+                self._config_cache[keys] = result
+        return result
 
     def get_config_with_defaults(
         self, *pairs: Tuple[str, Optional[str]]
@@ -1152,6 +1226,10 @@ class SparkConnectClient(object):
             raise SparkConnectException("Invalid state during retry exception handling.")
         except Exception as error:
             self._handle_error(error)
+        finally:
+            # Invalidate only once the server has applied the change.
+            if operation.WhichOneof("op_type") in ("set", "unset"):
+                self._invalidate_config_cache()
 
     def _interrupt_request(self, interrupt_type: str) -> pb2.InterruptRequest:
         req = pb2.InterruptRequest()
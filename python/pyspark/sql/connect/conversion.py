@@ -271,22 +271,39 @@ class LocalDataToArrowConversion:
             LocalDataToArrowConversion._create_converter(field.dataType) for field in schema.fields
         ]
 
-        pylist: List[List] = [[] for _ in range(len(column_names))]
-
-        for item in data:
-            if not isinstance(item, Row) and hasattr(item, "__dict__"):
-                item = item.__dict__
-            if isinstance(item, dict):
-                for i, col in enumerate(column_names):
-                    pylist[i].append(column_convs[i](item.get(col)))
-            else:
-                if len(item) != len(column_names):
-                    raise ValueError(
-                        f"Length mismatch: Expected axis has {len(column_names)} elements, "
-                        f"new values have {len(item)} elements"
-                    )
-                for i in range(len(column_names)):
-                    pylist[i].append(column_convs[i](item[i]))
+        pylist: List[List]
+
+        if all(
+            isinstance(item, (tuple, list))
+            and (isinstance(item, Row) or not hasattr(item, "__dict__"))
+            and len(item) == len(column_names)
+            for item in data
+        ):
+            # All rows are positional with the expected length: transpose them into columns
+            # at once, and skip the converters that are no-ops.
+            pylist = [
+                [conv(value) for value in column]
+                if LocalDataToArrowConversion._need_converter(field.dataType)
+                else list(column)
+                for column, conv, field in zip(zip(*data), column_convs, schema.fields)
+            ]
+        else:
+            pylist = [[] for _ in range(len(column_names))]
+
+            for item in data:
+                if not isinstance(item, Row) and hasattr(item, "__dict__"):
+                    item = item.__dict__
+                if isinstance(item, dict):
+                    for i, col in enumerate(column_names):
+                        pylist[i].append(column_convs[i](item.get(col)))
+                else:
+                    if len(item) != len(column_names):
+                        raise ValueError(
+                            f"Length mismatch: Expected axis has {len(column_names)} elements, "
+                            f"new values have {len(item)} elements"
+                        )
+                    for i in range(len(column_names)):
+                        pylist[i].append(column_convs[i](item[i]))
 
         pa_schema = to_arrow_schema(
             StructType(
@@ -19,11 +19,9 @@ from pyspark.sql.connect.utils import check_dependencies
 check_dependencies(__name__)
 
 import os
-import warnings
 from collections.abc import Sized
-from distutils.version import LooseVersion
-from functools import reduce
-from threading import RLock
+from contextlib import contextmanager
+from threading import Lock, Thread
 from typing import (
     Optional,
     Any,
@@ -34,17 +32,10 @@ from typing import (
     cast,
     overload,
     Iterable,
+    Iterator,
     TYPE_CHECKING,
 )
 
-import numpy as np
-import pandas as pd
-import pyarrow as pa
-from pandas.api.types import (  # type: ignore[attr-defined]
-    is_datetime64_dtype,
-    is_datetime64tz_dtype,
-    is_timedelta64_dtype,
-)
 import urllib
 
 from pyspark import SparkContext, SparkConf, __version__
@@ -54,8 +45,6 @@ from pyspark.sql.connect.dataframe import DataFrame
 from pyspark.sql.connect.plan import SQL, Range, LocalRelation, CachedRelation
 from pyspark.sql.connect.readwriter import DataFrameReader
 from pyspark.sql.connect.streaming import DataStreamReader, StreamingQueryManager
-from pyspark.sql.pandas.serializers import ArrowStreamPandasSerializer
-from pyspark.sql.pandas.types import to_arrow_schema, to_arrow_type, _deduplicate_field_names
 from pyspark.sql.session import classproperty, SparkSession as PySparkSession
 from pyspark.sql.types import (
     _infer_schema,
@@ -64,9 +53,14 @@ from pyspark.sql.types import (
     Row,
     DataType,
     DayTimeIntervalType,
+    StructField,
     StructType,
     AtomicType,
     TimestampType,
+    BooleanType,
+    LongType,
+    DoubleType,
+    StringType,
 )
 from pyspark.sql.utils import to_str
 from pyspark.errors import (
@@ -78,22 +72,123 @@ from pyspark.errors import (
 )
 
 if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
     from pyspark.sql.connect._typing import OptionalPrimitiveType
     from pyspark.sql.connect.catalog import Catalog
     from pyspark.sql.connect.udf import UDFRegistration
 
 
+# Whether the current PySpark version is an unreleased version that is in development.
+_IS_DEV_VERSION = "dev" in __version__
+
+_CONNECT_JAR_MISSING_MSG = (
+    "Attempted to automatically find the Spark Connect jars because "
+    "'SPARK_TESTING' environment variable is set, or the current "
+    f"PySpark version is dev version ({__version__}). However, the jar"
+    " was not found. Manually locate the jars and specify them, e.g., "
+    "'spark.jars' configuration."
+)
+
 # `_active_spark_session` stores the active spark connect session created by
 # `SparkSession.builder.getOrCreate`. It is used by ML code.
 _active_spark_session = None
+# Guards the creation of `_active_spark_session`.
+_active_spark_session_lock = Lock()
+
+# Cached JVM and its Py4J handle of `PythonSQLUtils`, see `_get_python_sql_utils`.
+_PYTHON_SQL_UTILS: Optional[Tuple[Any, Any]] = None
+
+
+def _get_python_sql_utils(jvm: Any) -> Any:
+    """
+    Returns the Py4J handle of `PythonSQLUtils` in the given JVM. The handle is resolved
+    once per JVM, instead of round-tripping to the JVM on every lookup.
+    """
+    global _PYTHON_SQL_UTILS
+    with SparkContext._lock:
+        if _PYTHON_SQL_UTILS is None or _PYTHON_SQL_UTILS[0] is not jvm:
+            _PYTHON_SQL_UTILS = (jvm, jvm.PythonSQLUtils)
+        return _PYTHON_SQL_UTILS[1]
+
+
+@contextmanager
+def _swap_env(key: str, value: Optional[str]) -> Iterator[None]:
+    """
+    Temporarily sets the environment variable `key` to `value`, or unsets it if `value` is
+    None, and restores the original state on exit. `os.environ` is only modified when the
+    value actually changes.
+    """
+    origin = os.environ.get(key)
+    if value != origin:
+        if value is None:
+            del os.environ[key]
+        else:
+            os.environ[key] = value
+    try:
+        yield
+    finally:
+        if os.environ.get(key) != origin:
+            if origin is None:
+                del os.environ[key]
+            else:
+                os.environ[key] = origin
+
+
+# Attributes of the regular PySpark session that are not available in Spark Connect.
+_JVM_ATTRIBUTES = frozenset(["_jsc", "_jconf", "_jvm", "_jsparkSession"])
+_NOT_IMPLEMENTED_ATTRIBUTES = frozenset(["newSession", "sparkContext"])
+
+# Python types whose inferred Spark type depends neither on the value nor on configurations.
+_PRIMITIVE_TYPE_MAPPINGS: Dict[type, DataType] = {
+    bool: BooleanType(),
+    int: LongType(),
+    float: DoubleType(),
+    str: StringType(),
+}
+
+
+def _infer_schema_from_primitive_rows(
+    data: List[Any], names: Optional[List[str]] = None
+) -> Optional[StructType]:
+    """
+    Infer the schema of plain tuples or lists of the same length, whose columns each hold
+    values of a single primitive type or None. The value types are checked column by column
+    instead of inferring and merging the schema of every row.
+    Returns None if `data` does not meet these conditions.
+    """
+    first = data[0]
+    if type(first) not in (tuple, list):
+        return None
+    # Check the first row before scanning all of them, so that unsupported values such as
+    # datetimes fall back without an extra pass over the data.
+    if any(value is not None and type(value) not in _PRIMITIVE_TYPE_MAPPINGS for value in first):
+        return None
+    width = len(first)
+    if any(type(row) not in (tuple, list) or len(row) != width for row in data):
+        return None
+
+    data_types = []
+    for i in range(width):
+        value_types = {type(row[i]) for row in data}
+        value_types.discard(type(None))
+        if len(value_types) != 1:
+            return None
+        data_type = _PRIMITIVE_TYPE_MAPPINGS.get(value_types.pop())
+        if data_type is None:
+            return None
+        data_types.append(data_type)
+
+    # Resolve the field names exactly as `_infer_schema` does, including extending `names`.
+    fields = _infer_schema(first, names).fields
+    return StructType([StructField(f.name, dt, True) for f, dt in zip(fields, data_types)])
 
 
 class SparkSession:
     class Builder:
         """Builder for :class:`SparkSession`."""
 
-        _lock = RLock()
-
         def __init__(self) -> None:
             self._options: Dict[str, Any] = {}
             self._channel_builder: Optional[ChannelBuilder] = None
@@ -113,13 +208,12 @@ class SparkSession:
             *,
             map: Optional[Dict[str, "OptionalPrimitiveType"]] = None,
         ) -> "SparkSession.Builder":
-            with self._lock:
-                if map is not None:
-                    for k, v in map.items():
-                        self._options[k] = to_str(v)
-                else:
-                    self._options[cast(str, key)] = to_str(value)
-                return self
+            if map is not None:
+                for k, v in map.items():
+                    self._options[k] = to_str(v)
+            else:
+                self._options[cast(str, key)] = to_str(value)
+            return self
 
         def master(self, master: str) -> "SparkSession.Builder":
             return self
@@ -152,11 +246,10 @@ class SparkSession:
             -------
             :class:`SparkSession.Builder`
             """
-            with self._lock:
-                # self._channel_builder is a separate field, because it may hold the state
-                # and cannot be serialized with to_str()
-                self._channel_builder = channelBuilder
-                return self
+            # self._channel_builder is a separate field, because it may hold the state
+            # and cannot be serialized with to_str()
+            self._channel_builder = channelBuilder
+            return self
 
         def enableHiveSupport(self) -> "SparkSession.Builder":
             raise PySparkNotImplementedError(
@@ -178,20 +271,43 @@ class SparkSession:
                     "Needs either connection string or channelBuilder to create a new SparkSession."
                 )
 
+            pool_size_key = "spark.connect.grpc.channel.pool.size"
+            pool_size = str(self._options.get(pool_size_key, "4"))
+            if not pool_size.isdigit() or int(pool_size) < 1:
+                raise PySparkValueError(
+                    error_class="VALUE_NOT_POSITIVE",
+                    message_parameters={"arg_name": pool_size_key, "arg_value": pool_size},
+                )
+            channel_pool_size = int(pool_size)
+            warmup_channels = (
+                str(self._options.get("spark.connect.grpc.channel.warmup", "true")).lower()
+                == "true"
+            )
+
             if has_channel_builder:
                 assert self._channel_builder is not None
-                return SparkSession(connection=self._channel_builder)
+                return SparkSession(
+                    connection=self._channel_builder,
+                    channelPoolSize=channel_pool_size,
+                    warmupChannels=warmup_channels,
+                )
             else:
                 spark_remote = to_str(self._options.get("spark.remote"))
                 assert spark_remote is not None
-                return SparkSession(connection=spark_remote)
+                return SparkSession(
+                    connection=spark_remote,
+                    channelPoolSize=channel_pool_size,
+                    warmupChannels=warmup_channels,
+                )
 
         def getOrCreate(self) -> "SparkSession":
             global _active_spark_session
             if _active_spark_session is not None:
                 return _active_spark_session
-            _active_spark_session = self.create()
-            return _active_spark_session
+            with _active_spark_session_lock:
+                if _active_spark_session is None:
+                    _active_spark_session = self.create()
+                return _active_spark_session
 
     _client: SparkConnectClient
 
@@ -200,7 +316,13 @@ class SparkSession:
         """Creates a :class:`Builder` for constructing a :class:`SparkSession`."""
         return cls.Builder()
 
-    def __init__(self, connection: Union[str, ChannelBuilder], userId: Optional[str] = None):
+    def __init__(
+        self,
+        connection: Union[str, ChannelBuilder],
+        userId: Optional[str] = None,
+        channelPoolSize: int = 4,
+        warmupChannels: bool = True,
+    ):
         """
         Creates a new SparkSession for the Spark Connect interface.
 
@@ -215,9 +337,23 @@ class SparkSession:
             isolate their Spark Sessions. If the `user_id` is not set, will default to
             the $USER environment. Defining the user ID as part of the connection string
             takes precedence.
+        channelPoolSize : int
+            Number of GRPC channels the client distributes its RPCs over. Defaults to 4.
+        warmupChannels : bool
+            Whether to connect the GRPC channels in the background right away.
+            Defaults to True.
         """
-        self._client = SparkConnectClient(connection=connection, userId=userId)
+        self._client = SparkConnectClient(
+            connection=connection, userId=userId, channelPoolSize=channelPoolSize
+        )
+        # Connect in the background so that the handshake overlaps with the user's work
+        # before the first query.
+        if warmupChannels:
+            Thread(target=self._client._warmup, daemon=True).start()
         self._session_id = self._client._session_id
+        # Lazily created by the read-only `catalog` and `streams` properties.
+        self._catalog: Optional["Catalog"] = None
+        self._streams: Optional[StreamingQueryManager] = None
 
     def table(self, tableName: str) -> DataFrame:
         return self.read.table(tableName)
@@ -234,6 +370,21 @@ class SparkSession:
     def readStream(self) -> "DataStreamReader":
         return DataStreamReader(self)
 
+    @property
+    def _driver_configs(self) -> Dict[str, Optional[str]]:
+        """
+        Configurations used by :meth:`createDataFrame`, fetched together in a single request.
+        The client caches the result until a configuration is changed.
+        """
+        keys = (
+            "spark.sql.session.timeZone",
+            "spark.sql.execution.pandas.convertToArrowArraySafely",
+            "spark.sql.pyspark.inferNestedDictAsStruct.enabled",
+            "spark.sql.pyspark.legacy.inferArrayTypeFromFirstElement.enabled",
+            "spark.sql.timestampType",
+        )
+        return dict(zip(keys, self._client.get_configs(*keys)))
+
     def _inferSchemaFromList(
         self, data: Iterable[Any], names: Optional[List[str]] = None
     ) -> StructType:
@@ -246,34 +397,56 @@ class SparkSession:
                 message_parameters={},
             )
 
-        (
-            infer_dict_as_struct,
-            infer_array_from_first_element,
-            prefer_timestamp_ntz,
-        ) = self._client.get_configs(
-            "spark.sql.pyspark.inferNestedDictAsStruct.enabled",
-            "spark.sql.pyspark.legacy.inferArrayTypeFromFirstElement.enabled",
-            "spark.sql.timestampType",
-        )
-        return reduce(
-            _merge_type,
-            (
-                _infer_schema(
-                    row,
-                    names,
-                    infer_dict_as_struct=(infer_dict_as_struct == "true"),
-                    infer_array_from_first_element=(infer_array_from_first_element == "true"),
-                    prefer_timestamp_ntz=(prefer_timestamp_ntz == "TIMESTAMP_NTZ"),
-                )
-                for row in data
-            ),
-        )
+        configs = self._driver_configs
+        infer_dict_as_struct = configs["spark.sql.pyspark.inferNestedDictAsStruct.enabled"]
+        infer_array_from_first_element = configs[
+            "spark.sql.pyspark.legacy.inferArrayTypeFromFirstElement.enabled"
+        ]
+        prefer_timestamp_ntz = configs["spark.sql.timestampType"]
+
+        schema: Optional[StructType] = None
+        if isinstance(data, list):
+            schema = _infer_schema_from_primitive_rows(data, names)
+            if schema is not None:
+                return schema
+
+        for row in data:
+            row_schema = _infer_schema(
+                row,
+                names,
+                infer_dict_as_struct=(infer_dict_as_struct == "true"),
+                infer_array_from_first_element=(infer_array_from_first_element == "true"),
+                prefer_timestamp_ntz=(prefer_timestamp_ntz == "TIMESTAMP_NTZ"),
+            )
+            # Homogeneous rows infer the same schema, and merging a schema with an equal one
+            # is a no-op. Skip the merge in that case instead of walking the type tree.
+            if schema is None:
+                schema = row_schema
+            elif row_schema != schema:
+                schema = _merge_type(schema, row_schema)
+        return cast(StructType, schema)
 
     def createDataFrame(
         self,
         data: Union["pd.DataFrame", "np.ndarray", Iterable[Any]],
         schema: Optional[Union[AtomicType, StructType, str, List[str], Tuple[str, ...]]] = None,
     ) -> "DataFrame":
+        import numpy as np
+        import pandas as pd
+        import pyarrow as pa
+        from pandas.api.types import (  # type: ignore[attr-defined]
+            is_datetime64_dtype,
+            is_datetime64tz_dtype,
+            is_timedelta64_dtype,
+        )
+
+        from pyspark.sql.pandas.serializers import ArrowStreamPandasSerializer
+        from pyspark.sql.pandas.types import (
+            to_arrow_schema,
+            to_arrow_type,
+            _deduplicate_field_names,
+        )
+
         assert data is not None
         if isinstance(data, DataFrame):
             raise PySparkTypeError(
@@ -298,8 +471,8 @@ class SparkSession:
                 _num_cols = 1
 
         elif isinstance(schema, (list, tuple)):
-            # Must re-encode any unicode strings to be consistent with StructField names
-            _cols = [x.encode("utf-8") if not isinstance(x, str) else x for x in schema]
+            # Column names must be strings to be consistent with StructField names
+            _cols = [str(x) for x in schema]
             _num_cols = len(_cols)
 
         if isinstance(data, np.ndarray) and data.ndim not in [1, 2]:
@@ -324,7 +497,7 @@ class SparkSession:
 
             # If no schema supplied by user then get the names of columns only
             if schema is None:
-                _cols = [str(x) if not isinstance(x, str) else x for x in data.columns]
+                _cols = [str(x) for x in data.columns]
             elif isinstance(schema, (list, tuple)) and cast(int, _num_cols) < len(data.columns):
                 assert isinstance(_cols, list)
                 _cols.extend([f"_{i + 1}" for i in range(cast(int, _num_cols), len(data.columns))])
@@ -339,7 +512,7 @@ class SparkSession:
                 spark_types = [field.dataType for field in deduped_schema.fields]
                 arrow_schema = to_arrow_schema(deduped_schema)
                 arrow_types = [field.type for field in arrow_schema]
-                _cols = [str(x) if not isinstance(x, str) else x for x in schema.fieldNames()]
+                _cols = [str(x) for x in schema.fieldNames()]
             elif isinstance(schema, DataType):
                 raise PySparkTypeError(
                     error_class="UNSUPPORTED_DATA_TYPE_FOR_ARROW",
@@ -357,22 +530,37 @@ class SparkSession:
                 ]
                 arrow_types = [to_arrow_type(dt) if dt is not None else None for dt in spark_types]
 
-            timezone, safecheck = self._client.get_configs(
-                "spark.sql.session.timeZone", "spark.sql.execution.pandas.convertToArrowArraySafely"
-            )
-
-            ser = ArrowStreamPandasSerializer(cast(str, timezone), safecheck == "true")
+            configs = self._driver_configs
+            timezone = configs["spark.sql.session.timeZone"]
+            safecheck = configs["spark.sql.execution.pandas.convertToArrowArraySafely"]
 
-            _table = pa.Table.from_batches(
-                [
-                    ser._create_batch(
-                        [
-                            (c, at, st)
-                            for (_, c), at, st in zip(data.items(), arrow_types, spark_types)
-                        ]
-                    )
-                ]
-            )
+            if (
+                all(at is None for at in arrow_types)
+                and data.columns.is_unique
+                and not any(isinstance(t, pd.CategoricalDtype) for t in data.dtypes)
+            ):
+                # No column needs to be coerced, so let Arrow convert the whole DataFrame at
+                # once. On failure, fall back to the conversion below that raises a proper error.
+                try:
+                    _table = pa.Table.from_pandas(
+                        data, preserve_index=False, safe=(safecheck == "true")
+                    ).replace_schema_metadata()
+                except (TypeError, ValueError):
+                    pass
+
+            if _table is None:
+                ser = ArrowStreamPandasSerializer(cast(str, timezone), safecheck == "true")
+
+                _table = pa.Table.from_batches(
+                    [
+                        ser._create_batch(
+                            [
+                                (c, at, st)
+                                for (_, c), at, st in zip(data.items(), arrow_types, spark_types)
+                            ]
+                        )
+                    ]
+                )
 
             if isinstance(schema, StructType):
                 assert arrow_schema is not None
@@ -408,20 +596,29 @@ class SparkSession:
                         },
                     )
 
+                # Convert to column-major order once so that each column is a contiguous
+                # view, instead of letting Arrow gather every column from a strided view.
                 _table = pa.Table.from_arrays(
-                    [pa.array(data[::, i]) for i in range(0, data.shape[1])], _cols
+                    [pa.array(column) for column in np.asfortranarray(data).T], _cols
                 )
 
             # The _table should already have the proper column names.
             _cols = None
 
         else:
-            _data = list(data)
+            # Avoid copying the input when it is already a list; it is never mutated below.
+            _data = data if isinstance(data, list) else list(data)
 
             if isinstance(_data[0], dict):
                 # Sort the data to respect inferred schema.
                 # For dictionaries, we sort the schema in alphabetical order.
-                _data = [dict(sorted(d.items())) if d is not None else None for d in _data]
+                # Dictionaries whose keys are already in that order are reused as they are.
+                sorted_keys = sorted(_data[0])
+                if any(d is not None and list(d) != sorted_keys for d in _data):
+                    _data = [
+                        dict(sorted(d.items())) if d is not None and list(d) != sorted_keys else d
+                        for d in _data
+                    ]
 
             elif not isinstance(_data[0], (Row, tuple, list, dict)) and not hasattr(
                 _data[0], "__dict__"
@@ -466,13 +663,23 @@ class SparkSession:
             )
 
         if _schema is not None:
-            df = DataFrame.withPlan(LocalRelation(_table, schema=_schema.json()), self)
+            if isinstance(_schema, StructType) and _cols is not None and _cols != _schema.names:
+                # Schemas inferred from dicts, Rows, namedtuples or objects take their field
+                # names from the data, so apply the given column names on top of them.
+                _schema = StructType(
+                    [
+                        StructField(name, field.dataType, field.nullable, field.metadata)
+                        for name, field in zip(_cols, _schema.fields)
+                    ]
+                )
+            # The server side renames the columns per the schema.
+            return DataFrame.withPlan(LocalRelation(_table, schema=_schema.json()), self)
         else:
-            df = DataFrame.withPlan(LocalRelation(_table), self)
-
-        if _cols is not None and len(_cols) > 0:
-            df = df.toDF(*_cols)
-        return df
+            # Rename the columns in the Arrow table directly instead of adding an extra
+            # projection via `DataFrame.toDF`.
+            if _cols is not None and len(_cols) > 0:
+                _table = _table.rename_columns(_cols)
+            return DataFrame.withPlan(LocalRelation(_table), self)
 
     createDataFrame.__doc__ = PySparkSession.createDataFrame.__doc__
 
@@ -482,7 +689,7 @@ class SparkSession:
         if "sql_command_result" in properties:
             return DataFrame.withPlan(CachedRelation(properties["sql_command_result"]), self)
         else:
-            return DataFrame.withPlan(SQL(sqlQuery, args), self)
+            return DataFrame.withPlan(cmd, self)
 
     sql.__doc__ = PySparkSession.sql.__doc__
 
@@ -515,7 +722,7 @@ class SparkSession:
     def catalog(self) -> "Catalog":
         from pyspark.sql.connect.catalog import Catalog
 
-        if not hasattr(self, "_catalog"):
+        if self._catalog is None:
             self._catalog = Catalog(self)
         return self._catalog
 
@@ -572,14 +779,16 @@ class SparkSession:
 
     @property
     def streams(self) -> "StreamingQueryManager":
-        return StreamingQueryManager(self)
+        if self._streams is None:
+            self._streams = StreamingQueryManager(self)
+        return self._streams
 
     def __getattr__(self, name: str) -> Any:
-        if name in ["_jsc", "_jconf", "_jvm", "_jsparkSession"]:
+        if name in _JVM_ATTRIBUTES:
             raise PySparkAttributeError(
                 error_class="JVM_ATTRIBUTE_NOT_SUPPORTED", message_parameters={"attr_name": name}
             )
-        elif name in ["newSession", "sparkContext"]:
+        elif name in _NOT_IMPLEMENTED_ATTRIBUTES:
             raise PySparkNotImplementedError(
                 error_class="NOT_IMPLEMENTED", message_parameters={"feature": f"{name}()"}
             )
@@ -735,18 +944,13 @@ class SparkSession:
 
             # Check if we're using unreleased version that is in development.
             # Also checks SPARK_TESTING for RC versions.
-            is_dev_mode = (
-                "dev" in LooseVersion(__version__).version or "SPARK_TESTING" in os.environ
-            )
-
-            origin_remote = os.environ.get("SPARK_REMOTE", None)
-            try:
-                if origin_remote is not None:
-                    # So SparkSubmit thinks no remote is set in order to
-                    # start the regular PySpark session.
-                    del os.environ["SPARK_REMOTE"]
+            is_dev_mode = _IS_DEV_VERSION or "SPARK_TESTING" in os.environ
 
+            # So SparkSubmit thinks no remote is set in order to
+            # start the regular PySpark session.
+            with _swap_env("SPARK_REMOTE", None):
                 SparkContext._ensure_initialized(conf=create_conf(loadDefaults=False))
+                jvm = SparkContext._jvm
 
                 if is_dev_mode:
                     # Try and catch for a possibility in production because pyspark.testing
@@ -760,28 +964,24 @@ class SparkSession:
                             "connector/connect/server", "spark-connect-assembly-", "spark-connect"
                         )
                         if connect_jar is None:
-                            warnings.warn(
-                                "Attempted to automatically find the Spark Connect jars because "
-                                "'SPARK_TESTING' environment variable is set, or the current "
-                                f"PySpark version is dev version ({__version__}). However, the jar"
-                                " was not found. Manually locate the jars and specify them, e.g., "
-                                "'spark.jars' configuration."
-                            )
+                            import warnings
+
+                            warnings.warn(_CONNECT_JAR_MISSING_MSG)
                         else:
-                            pyutils = SparkContext._jvm.PythonSQLUtils  # type: ignore[union-attr]
-                            pyutils.addJarToCurrentClassLoader(connect_jar)
+                            _get_python_sql_utils(jvm).addJarToCurrentClassLoader(connect_jar)
 
                     except ImportError:
                         pass
 
+                # `SparkContext.getOrCreate` ignores the given configurations if there is
+                # an active context, so avoid building them in that case.
+                sc = SparkContext._active_spark_context
+                if sc is None:
+                    sc = SparkContext.getOrCreate(create_conf(loadDefaults=True, _jvm=jvm))
+
                 # The regular PySpark session is registered as an active session
                 # so would not be garbage-collected.
-                PySparkSession(
-                    SparkContext.getOrCreate(create_conf(loadDefaults=True, _jvm=SparkContext._jvm))
-                )
-            finally:
-                if origin_remote is not None:
-                    os.environ["SPARK_REMOTE"] = origin_remote
+                PySparkSession(sc)
         else:
             raise PySparkRuntimeError(
                 error_class="SESSION_OR_CONTEXT_EXISTS",
@@ -797,39 +997,55 @@ SparkSession.__doc__ = PySparkSession.__doc__
 
 
 def _test() -> None:
+    # Skip starting and stopping a session when running with optimizations, e.g., `python -O`.
+    if not __debug__:
+        return
+
     import sys
     import doctest
     from pyspark.sql import SparkSession as PySparkSession
     import pyspark.sql.connect.session
 
-    globs = pyspark.sql.connect.session.__dict__.copy()
-    globs["spark"] = (
-        PySparkSession.builder.appName("sql.connect.session tests").remote("local[4]").getOrCreate()
-    )
+    optionflags = doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE | doctest.IGNORE_EXCEPTION_DETAIL
 
-    # Uses PySpark session to test builder.
-    globs["SparkSession"] = PySparkSession
-    # Spark Connect does not support to set master together.
-    pyspark.sql.connect.session.SparkSession.__doc__ = None
-    del pyspark.sql.connect.session.SparkSession.Builder.master.__doc__
-    # RDD API is not supported in Spark Connect.
-    del pyspark.sql.connect.session.SparkSession.createDataFrame.__doc__
-
-    # TODO(SPARK-41811): Implement SparkSession.sql's string formatter
-    del pyspark.sql.connect.session.SparkSession.sql.__doc__
-
-    (failure_count, test_count) = doctest.testmod(
-        pyspark.sql.connect.session,
-        globs=globs,
-        optionflags=doctest.ELLIPSIS
-        | doctest.NORMALIZE_WHITESPACE
-        | doctest.IGNORE_EXCEPTION_DETAIL,
+    # The doctests only refer to `spark` and `SparkSession`, so there is no need to copy
+    # the whole module namespace.
+    spark = (
+        PySparkSession.builder.appName("sql.connect.session tests").remote("local[4]").getOrCreate()
     )
+    globs = {
+        "__name__": pyspark.sql.connect.session.__name__,
+        "spark": spark,
+        # Uses PySpark session to test builder.
+        "SparkSession": PySparkSession,
+    }
+
+    # Names of the docstrings to skip, instead of removing them from the classes.
+    prefix = f"{pyspark.sql.connect.session.__name__}.SparkSession"
+    skipped = {
+        # Spark Connect does not support to set master together.
+        prefix,
+        f"{prefix}.Builder.master",
+        # RDD API is not supported in Spark Connect.
+        f"{prefix}.createDataFrame",
+        # TODO(SPARK-41811): Implement SparkSession.sql's string formatter
+        f"{prefix}.sql",
+    }
+
+    runner = doctest.DocTestRunner(optionflags=optionflags)
+    for test in doctest.DocTestFinder().find(pyspark.sql.connect.session, globs=globs):
+        if test.name not in skipped:
+            runner.run(test)
+    (failure_count, test_count) = runner.summarize(verbose=False)
 
     globs["spark"].stop()
 
     if failure_count:
-        sys.exit(-1)
+        # The session was stopped above, so skip the atexit handlers that would go through
+        # the JVM shutdown again. `os._exit` does not flush, so flush the doctest report first.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(-1)
 
 
 if __name__ == "__main__":
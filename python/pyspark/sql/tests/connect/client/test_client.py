@@ -15,16 +15,20 @@
 # limitations under the License.
 #
 
+import time
 import unittest
 from typing import Optional
+from unittest.mock import patch
 
 from pyspark.sql.connect.client import SparkConnectClient, ChannelBuilder
 import pyspark.sql.connect.proto as proto
 from pyspark.testing.connectutils import should_test_connect, connect_requirement_message
 
 if should_test_connect:
+    import grpc
     import pandas as pd
     import pyarrow as pa
+    from pyspark.sql.connect.session import SparkSession as RemoteSparkSession
 
 
 @unittest.skipIf(not should_test_connect, connect_requirement_message)
@@ -32,7 +36,7 @@ class SparkConnectClientTestCase(unittest.TestCase):
     def test_user_agent_passthrough(self):
         client = SparkConnectClient("sc://foo/;user_agent=bar")
         mock = MockService(client._session_id)
-        client._stub = mock
+        client._stubs = [mock]
 
         command = proto.Command()
         client.execute_command(command)
@@ -43,7 +47,7 @@ class SparkConnectClientTestCase(unittest.TestCase):
     def test_user_agent_default(self):
         client = SparkConnectClient("sc://foo/")
         mock = MockService(client._session_id)
-        client._stub = mock
+        client._stubs = [mock]
 
         command = proto.Command()
         client.execute_command(command)
@@ -71,10 +75,96 @@ class SparkConnectClientTestCase(unittest.TestCase):
 
         self.assertEqual(client._user_id, "abc")
 
+    def test_channel_pool_round_robin(self):
+        with patch("grpc.insecure_channel", wraps=grpc.insecure_channel) as insecure_channel:
+            client = SparkConnectClient("sc://foo/", channelPoolSize=3)
+        try:
+            self.assertEqual(len(client._channels), 3)
+            self.assertEqual(insecure_channel.call_count, 3)
+            # Each pooled channel must not share its connection with the others.
+            for call in insecure_channel.call_args_list:
+                self.assertIn(("grpc.use_local_subchannel_pool", 1), call.kwargs["options"])
+
+            stubs = [client._stub for _ in range(6)]
+            self.assertEqual(len({id(stub) for stub in stubs}), 3)
+            self.assertEqual(stubs[:3], stubs[3:])
+        finally:
+            client.close()
+
+    def test_channel_pool_with_custom_to_channel(self):
+        class CustomChannelBuilder(ChannelBuilder):
+            def toChannel(self):
+                return super().toChannel()
+
+        spark = (
+            RemoteSparkSession.builder.channelBuilder(CustomChannelBuilder("sc://foo/"))
+            .config("spark.connect.grpc.channel.warmup", "false")
+            .create()
+        )
+        try:
+            # A custom toChannel cannot give each channel its own connection.
+            self.assertEqual(len(spark.client._channels), 1)
+        finally:
+            spark.client.close()
+
+    def test_warmup_shares_deadline(self):
+        client = SparkConnectClient("sc://foo/", channelPoolSize=4)
+        start = time.monotonic()
+        client._warmup(timeout=0.5)
+        # The channels cannot connect, but all of them give up at the same deadline.
+        self.assertLess(time.monotonic() - start, 1.5)
+        client.close()
+
+    def test_warmup_disabled_by_builder_option(self):
+        with patch("pyspark.sql.connect.session.Thread") as thread:
+            spark = (
+                RemoteSparkSession.builder.remote("sc://foo/")
+                .config("spark.connect.grpc.channel.warmup", "false")
+                .create()
+            )
+            spark.client.close()
+            thread.assert_not_called()
+
+            spark = RemoteSparkSession.builder.remote("sc://foo/").create()
+            spark.client.close()
+            thread.assert_called_once_with(target=spark.client._warmup, daemon=True)
+
+    def test_get_configs_cached(self):
+        client = SparkConnectClient("sc://foo/")
+        mock = MockService(client._session_id)
+        client._stubs = [mock]
+
+        self.assertEqual(client.get_configs("a", "b"), ("a_value", "b_value"))
+        self.assertEqual(client.get_configs("a", "b"), ("a_value", "b_value"))
+        self.assertEqual(mock.config_count, 1)
+
+        # Setting a configuration invalidates the cache.
+        op_set = proto.ConfigRequest.Set(pairs=[proto.KeyValue(key="a", value="c")])
+        client.config(proto.ConfigRequest.Operation(set=op_set))
+        client.get_configs("a", "b")
+        self.assertEqual(mock.config_count, 3)
+
+    def test_get_configs_invalidated_after_command(self):
+        client = SparkConnectClient("sc://foo/")
+        mock = MockService(client._session_id)
+        client._stubs = [mock]
+        execute_plan = mock.ExecutePlan
+
+        def execute_plan_with_concurrent_read(req, metadata):
+            # A read while the command is running must not be cached past the command.
+            client.get_configs("a")
+            return execute_plan(req, metadata)
+
+        mock.ExecutePlan = execute_plan_with_concurrent_read
+        client.execute_command(proto.Command())
+        self.assertEqual(mock.config_count, 1)
+        client.get_configs("a")
+        self.assertEqual(mock.config_count, 2)
+
     def test_interrupt_all(self):
         client = SparkConnectClient("sc://foo/;token=bar")
         mock = MockService(client._session_id)
-        client._stub = mock
+        client._stubs = [mock]
 
         client.interrupt_all()
         self.assertIsNotNone(mock.req, "Interrupt API was not called when expected")
@@ -89,6 +179,7 @@ class MockService:
     def __init__(self, session_id: str):
         self._session_id = session_id
         self.req = None
+        self.config_count = 0
 
     def ExecutePlan(self, req: proto.ExecutePlanRequest, metadata):
         self.req = req
@@ -108,6 +199,16 @@ class MockService:
         resp.arrow_batch.data = buf.to_pybytes()
         return [resp]
 
+    def Config(self, req: proto.ConfigRequest, metadata):
+        self.req = req
+        self.config_count += 1
+        resp = proto.ConfigResponse()
+        resp.session_id = self._session_id
+        if req.operation.HasField("get"):
+            for key in req.operation.get.keys:
+                resp.pairs.append(proto.KeyValue(key=key, value=f"{key}_value"))
+        return resp
+
     def Interrupt(self, req: proto.InterruptRequest, metadata):
         self.req = req
         resp = proto.InterruptResponse()
@@ -21,7 +21,8 @@ import os
 import unittest
 import shutil
 import tempfile
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from functools import reduce
 
 from pyspark.errors import (
     PySparkAttributeError,
@@ -40,6 +41,8 @@ from pyspark.sql.types import (
     MapType,
     ArrayType,
     Row,
+    _infer_schema,
+    _merge_type,
 )
 
 from pyspark.testing.sqlutils import (
@@ -66,7 +69,10 @@ if should_test_connect:
     import pandas as pd
     import numpy as np
     from pyspark.sql.connect.proto import Expression as ProtoExpression
-    from pyspark.sql.connect.session import SparkSession as RemoteSparkSession
+    from pyspark.sql.connect.session import (
+        SparkSession as RemoteSparkSession,
+        _infer_schema_from_primitive_rows,
+    )
     from pyspark.sql.connect.client import ChannelBuilder
     from pyspark.sql.connect.column import Column
     from pyspark.sql.connect.readwriter import DataFrameWriterV2
@@ -954,6 +960,22 @@ class SparkConnectBasicTests(SparkConnectSQLTestCase):
         self.assertEqual(cdf.schema, sdf.schema)
         self.assertEqual(cdf.collect(), sdf.collect())
 
+    def test_create_df_with_column_names_from_named_rows(self):
+        Point = namedtuple("Point", ["x", "y"])
+        for data in [
+            [{"x": 1, "y": "a"}],
+            [Row(x=1, y="a")],
+            [Point(1, "a")],
+            [MyObject(1, "a")],
+        ]:
+            with self.subTest(data=data):
+                cdf = self.connect.createDataFrame(data, ["b", "c"])
+                sdf = self.spark.createDataFrame(data, ["b", "c"])
+
+                self.assertEqual(cdf.columns, ["b", "c"])
+                self.assertEqual(cdf.schema, sdf.schema)
+                self.assertEqual(cdf.collect(), sdf.collect())
+
     def test_simple_explain_string(self):
         df = self.connect.read.table(self.tbl_name).limit(10)
         result = df._explain_string()
@@ -3423,6 +3445,43 @@ class ClientTests(unittest.TestCase):
         self.assertEqual(call_wrap["raised"], 1)
 
 
+@unittest.skipIf(not should_test_connect, connect_requirement_message)
+class PrimitiveSchemaInferenceTests(unittest.TestCase):
+    def assert_same_as_merged_schema(self, data, names=None):
+        schema = _infer_schema_from_primitive_rows(data, None if names is None else list(names))
+        self.assertIsNotNone(schema)
+        names = None if names is None else list(names)
+        self.assertEqual(schema, reduce(_merge_type, (_infer_schema(row, names) for row in data)))
+
+    def test_primitive_rows(self):
+        self.assert_same_as_merged_schema([(1, "a", 1.0, True), (2, "b", 2.0, False)])
+        self.assert_same_as_merged_schema([[1, "a"], [2, "b"]])
+        self.assert_same_as_merged_schema([(1, None), (None, "b")])
+
+    def test_names(self):
+        data = [(1, "a", 1.0), (2, "b", 2.0)]
+        self.assert_same_as_merged_schema(data, ["x", "y", "z"])
+        self.assert_same_as_merged_schema(data, ["x"])
+        self.assert_same_as_merged_schema(data, ["x", "y", "z", "w"])
+
+    def test_falls_back(self):
+        for data in [
+            # None-only columns.
+            [(1, None), (2, None)],
+            # Mixed bool and int.
+            [(True,), (1,)],
+            # Ragged widths.
+            [(1, "a"), (2,)],
+            # Unsupported types.
+            [(datetime.datetime(2023, 1, 1), 1)],
+            # Non-plain tuples.
+            [Row(a=1), Row(a=2)],
+            [{"a": 1}],
+        ]:
+            with self.subTest(data=data):
+                self.assertIsNone(_infer_schema_from_primitive_rows(data))
+
+
 @unittest.skipIf(not should_test_connect, connect_requirement_message)
 class ChannelBuilderTests(unittest.TestCase):
     def test_invalid_connection_strings(self):
@@ -125,7 +125,11 @@ def to_str(value: Any) -> Optional[str]:
     A wrapper over str(), but converts bool values to lower case strings.
     If None is given, just returns None, instead of converting it to string "None".
     """
-    if isinstance(value, bool):
+    # Fast path for the most common case. Subclasses of str, e.g., str-based enums,
+    # still go through str() below.
+    if type(value) is str:
+        return value
+    elif isinstance(value, bool):
         return str(value).lower()
     elif value is None:
         return value